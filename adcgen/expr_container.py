@@ -2024,12 +2024,13 @@ class Obj(Container):
         if self.name == "D":
             tensor, exponent = self.base_and_exponent
             # upper indices are added, lower indices subtracted
-            explicit_denom = 0
-            for s in tensor.upper:
-                explicit_denom += NonSymmetricTensor("e", (s,))
-            for s in tensor.lower:
-                explicit_denom -= NonSymmetricTensor("e", (s,))
-            explicit_denom = Pow(explicit_denom, -exponent)
+            upper = NonSymmetricTensor.build_many(
+                "e", ((s,) for s in tensor.upper)
+            )
+            lower = NonSymmetricTensor.build_many(
+                "e", ((s,) for s in tensor.lower)
+            )
+            explicit_denom = Pow(Add(*upper) - Add(*lower), -exponent)
         else:
             explicit_denom = self.sympy
         if return_sympy:
@@ -1,9 +1,25 @@
 from sympy import S, Dummy
+from itertools import product
+import re
 from .misc import Inputerror, Singleton
 
 
 # base names for all used indices
 idx_base = {'occ': 'ijklmno', 'virt': 'abcdefgh', 'general': 'pqrstuvw'}
+# enumerate the canonically sorted combinations of space and spin, so they
+# can be packed in the sort key of an index
+_PREFIX_ID = {prefix: n for n, prefix in
+              enumerate(sorted(product("gov", ("", "a", "b"))))}
+# splits the name of an index in base name and number: "i12" -> "i", "12"
+_NAME_RE = re.compile(r'^([A-Za-z])(\d*)$')
+# the canonical key of an index packs
+# (id of space and spin, number in the name, base name, dummy index)
+# in a single int using the following number of bits for the fields.
+_NUM_BITS = 24
+_LETTER_BITS = 8
+_DUMMY_INDEX_BITS = 28
+# non Index objects are sorted after all indices
+_NON_INDEX_KEY = 1 << (4 + _NUM_BITS + _LETTER_BITS + _DUMMY_INDEX_BITS)
 
 
 class Index(Dummy):
@@ -16,6 +32,37 @@ class Index(Dummy):
     - alpha: The index represents an alpha (spatial) orbital.
     - beta: The index represents a beta (spatial) orbital.
     """
+    __slots__ = ('_space0', '_spin', '_name_num', '_name_letter',
+                 '_canonical_key')
+
+    def __new__(cls, name: str = None, dummy_index: int = None,
+                **assumptions):
+        obj = super().__new__(cls, name, dummy_index, **assumptions)
+        # parse the name once and store everything that is required to
+        # bring indices in canonical order
+        match = _NAME_RE.match(obj.name)
+        if match is None:
+            raise Inputerror(f"Invalid index name {obj.name}. Expected "
+                             "a single letter followed by an optional "
+                             "number.")
+        obj._name_letter = match.group(1)
+        obj._name_num = int(match.group(2)) if match.group(2) else 0
+        if obj._name_num >> _NUM_BITS:
+            raise Inputerror(f"The number in the index name {obj.name} is "
+                             "too large.")
+        obj._space0 = obj.space[0]
+        obj._spin = obj.spin
+        if obj.dummy_index >> _DUMMY_INDEX_BITS:
+            raise RuntimeError(f"The dummy index {obj.dummy_index} of "
+                               f"{obj.name} is too large.")
+        # also add the dummy index here for wicks, where multiple i are
+        # around. Like the equality of indices, it is preserved when
+        # an index is pickled or copied.
+        key = _PREFIX_ID[(obj._space0, obj._spin)]
+        key = (key << _NUM_BITS) | obj._name_num
+        key = (key << _LETTER_BITS) | ord(obj._name_letter)
+        obj._canonical_key = (key << _DUMMY_INDEX_BITS) | obj.dummy_index
+        return obj
 
     @property
     def spin(self) -> str:
@@ -294,14 +341,9 @@ def index_space(idx: str) -> str:
 def sort_idx_canonical(idx: Index):
     """Use as sort key to to bring indices in canonical order."""
     if isinstance(idx, Index):
-        # also add the hash here for wicks, where multiple i are around
-        return (idx.space[0],
-                idx.spin,
-                int(idx.name[1:]) if idx.name[1:] else 0,
-                idx.name[0],
-                hash(idx))
+        return idx._canonical_key
     else:  # necessary for subs to work correctly with simultaneous=True
-        return ('', 0, str(idx), hash(idx))
+        return _NON_INDEX_KEY | (hash(idx) & (_NON_INDEX_KEY - 1))
 
 
 def split_idx_string(str_tosplit: str) -> list:
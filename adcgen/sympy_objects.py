@@ -1,14 +1,18 @@
-from sympy.physics.secondquant import (
-    _sort_anticommuting_fermions, ViolationOfPauliPrinciple
-)
+from sympy.physics.secondquant import ViolationOfPauliPrinciple
 from sympy.core.function import Function
 from sympy.core.expr import Expr
 from sympy.core.logic import fuzzy_not
 from sympy import sympify, Tuple, Symbol, S
+from functools import lru_cache
+from collections.abc import Iterable
 from .misc import Inputerror
 from .indices import Index, sort_idx_canonical
 
 
+# the maximum number of tensors kept in the cache of each tensor class
+_TENSOR_CACHE_SIZE = 10000
+
+
 class SymbolicTensor(Expr):
     """Base class for symbolic tensors."""
 
@@ -54,38 +58,16 @@ class AntiSymmetricTensor(SymbolicTensor):
 
     def __new__(cls, name: str, upper: tuple[Index], lower: tuple[Index],
                 bra_ket_sym: int = 0):
-        # sort the upper and lower indices
-        try:
-            upper, sign_u = _sort_anticommuting_fermions(
-                upper, key=sort_idx_canonical
-            )
-            lower, sign_l = _sort_anticommuting_fermions(
-                lower, key=sort_idx_canonical
-            )
-        except ViolationOfPauliPrinciple:
-            return S.Zero
-        # additionally account for the bra ket symmetry
-        # add the Index check for subs to work correctly
-        bra_ket_sym = sympify(bra_ket_sym)
-        if bra_ket_sym is not S.Zero and \
-                all(isinstance(s, Index) for s in upper+lower):
-            if bra_ket_sym not in [S.One, S.NegativeOne]:
-                raise Inputerror("Invalid bra ket symmetry given "
-                                 f"{bra_ket_sym}. Valid are 0, 1 or -1.")
-            if cls._need_bra_ket_swap(upper, lower):
-                upper, lower = lower, upper  # swap
-                if bra_ket_sym is S.NegativeOne:  # add another -1
-                    sign_u += 1
-        # import all quantities to sympy
-        name = sympify(name)
-        upper, lower = Tuple(*upper), Tuple(*lower)
-
-        # attach -1 if necessary
-        if (sign_u + sign_l) % 2:
-            return - super().__new__(cls, name, upper, lower,
-                                     bra_ket_sym)
-        else:
-            return super().__new__(cls, name, upper, lower, bra_ket_sym)
+        return _build_antisym(cls, _sympify_symbol(name), tuple(upper),
+                              tuple(lower), bra_ket_sym)
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clears the cache of previously constructed tensors. The cache holds
+        at most the last '_TENSOR_CACHE_SIZE' constructed tensors.
+        """
+        _build_antisym.cache_clear()
 
     @classmethod
     def _need_bra_ket_swap(cls, upper: tuple[Index],
@@ -94,24 +76,24 @@ class AntiSymmetricTensor(SymbolicTensor):
             raise NotImplementedError("Bra Ket symmetry only implemented "
                                       "for tensors with an equal amount "
                                       "of upper and lower indices.")
+        if upper == lower:  # swapping identical index blocks does nothing
+            return False
         # compare the space of upper and lower indices
-        space_u = [s.space[0] for s in upper]
-        space_l = [s.space[0] for s in lower]
+        space_u = "".join(s._space0 for s in upper)
+        space_l = "".join(s._space0 for s in lower)
         if space_l < space_u:  # space with more occ should be upper
             return True
         elif space_l == space_u:  # diagonal block
             # compare the spin of both index blocks:
             # space with more spin orbitals or alpha spin should be upper.
-            spin_u = [s.spin for s in upper]
-            spin_l = [s.spin for s in lower]
+            spin_u = [s._spin for s in upper]
+            spin_l = [s._spin for s in lower]
             if spin_l < spin_u:
                 return True
             elif spin_l == spin_u:  # diagonal spin block
                 # compare the names of indices
-                lower_names = [(int(s.name[1:]) if s.name[1:] else 0,
-                               s.name[0]) for s in lower]
-                upper_names = [(int(s.name[1:]) if s.name[1:] else 0,
-                               s.name[0]) for s in upper]
+                lower_names = [(s._name_num, s._name_letter) for s in lower]
+                upper_names = [(s._name_num, s._name_letter) for s in upper]
                 if lower_names < upper_names:
                     return True
         return False
@@ -170,6 +152,47 @@ class AntiSymmetricTensor(SymbolicTensor):
         return self.upper.args + self.lower.args
 
 
+@lru_cache(maxsize=_TENSOR_CACHE_SIZE)
+def _build_antisym(cls, name: Symbol, upper: tuple[Index], lower: tuple[Index],
+                   bra_ket_sym: int):
+    """
+    Constructs an instance of an 'AntiSymmetricTensor' (sub)class. The
+    result is cached, because the same tensors are built over and over
+    during the generation of the ADC equations.
+    """
+    # sort the upper and lower indices
+    try:
+        upper, sign_u = _sort_with_parity(upper, key=sort_idx_canonical)
+        lower, sign_l = _sort_with_parity(lower, key=sort_idx_canonical)
+    except ViolationOfPauliPrinciple:
+        return S.Zero
+    sign = sign_u ^ sign_l
+    # additionally account for the bra ket symmetry
+    # add the Index check for subs to work correctly
+    # most tensors don't have bra ket symmetry -> avoid sympify for 0
+    if type(bra_ket_sym) is int and bra_ket_sym == 0:
+        bra_ket_sym = S.Zero
+    else:
+        bra_ket_sym = sympify(bra_ket_sym)
+    if bra_ket_sym is not S.Zero and \
+            all(isinstance(s, Index) for s in upper) and \
+            all(isinstance(s, Index) for s in lower):
+        if bra_ket_sym not in [S.One, S.NegativeOne]:
+            raise Inputerror("Invalid bra ket symmetry given "
+                             f"{bra_ket_sym}. Valid are 0, 1 or -1.")
+        if cls._need_bra_ket_swap(upper, lower):
+            upper, lower = lower, upper  # swap
+            if bra_ket_sym is S.NegativeOne:  # add another -1
+                sign ^= 1
+    # import all quantities to sympy
+    upper, lower = _to_sympy_tuple(upper), _to_sympy_tuple(lower)
+    tensor = super(AntiSymmetricTensor, cls).__new__(
+        cls, name, upper, lower, bra_ket_sym
+    )
+    # attach -1 if necessary
+    return -tensor if sign else tensor
+
+
 class Amplitude(AntiSymmetricTensor):
     """
     Represents antisymmetric Amplitudes.
@@ -207,34 +230,50 @@ class SymmetricTensor(AntiSymmetricTensor):
 
     def __new__(cls, name: str, upper: tuple[Index], lower: tuple[Index],
                 bra_ket_sym: int = 0):
-        # sort upper and lower. No need to track the number of swaps
-        upper = sorted(upper, key=sort_idx_canonical)
-        lower = sorted(lower, key=sort_idx_canonical)
-        # account for the bra ket symmetry
-        # add the Index check for subs to work correctly
-        negative_sign = False
+        return _build_sym(cls, _sympify_symbol(name), tuple(upper),
+                          tuple(lower), bra_ket_sym)
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clears the cache of previously constructed tensors. The cache holds
+        at most the last '_TENSOR_CACHE_SIZE' constructed tensors.
+        """
+        _build_sym.cache_clear()
+
+
+@lru_cache(maxsize=_TENSOR_CACHE_SIZE)
+def _build_sym(cls, name: Symbol, upper: tuple[Index], lower: tuple[Index],
+               bra_ket_sym: int):
+    """Constructs and caches an instance of a 'SymmetricTensor' (sub)class."""
+    # sort upper and lower. No need to track the number of swaps
+    upper = sorted(upper, key=sort_idx_canonical)
+    lower = sorted(lower, key=sort_idx_canonical)
+    # account for the bra ket symmetry
+    # add the Index check for subs to work correctly
+    negative_sign = False
+    # most tensors don't have bra ket symmetry -> avoid sympify for 0
+    if type(bra_ket_sym) is int and bra_ket_sym == 0:
+        bra_ket_sym = S.Zero
+    else:
         bra_ket_sym = sympify(bra_ket_sym)
-        if bra_ket_sym is not S.Zero and \
-                all(isinstance(s, Index) for s in upper+lower):
-            if bra_ket_sym not in [S.One, S.NegativeOne]:
-                raise Inputerror("Invalid bra ket symmetry given "
-                                 f"{bra_ket_sym}. Valid are 0, 1 or -1.")
-            if cls._need_bra_ket_swap(upper, lower):
-                upper, lower = lower, upper  # swap
-                if bra_ket_sym is S.NegativeOne:
-                    negative_sign = True
-        # import all quantities to sympy
-        name = sympify(name)
-        upper, lower = Tuple(*upper), Tuple(*lower)
-        # attach -1 if necessary
-        if negative_sign:
-            return - super(AntiSymmetricTensor, cls).__new__(
-                cls, name, upper, lower, bra_ket_sym
-            )
-        else:
-            return super(AntiSymmetricTensor, cls).__new__(
-                cls, name, upper, lower, bra_ket_sym
-            )
+    if bra_ket_sym is not S.Zero and \
+            all(isinstance(s, Index) for s in upper) and \
+            all(isinstance(s, Index) for s in lower):
+        if bra_ket_sym not in [S.One, S.NegativeOne]:
+            raise Inputerror("Invalid bra ket symmetry given "
+                             f"{bra_ket_sym}. Valid are 0, 1 or -1.")
+        if cls._need_bra_ket_swap(upper, lower):
+            upper, lower = lower, upper  # swap
+            if bra_ket_sym is S.NegativeOne:
+                negative_sign = True
+    # import all quantities to sympy
+    upper, lower = _to_sympy_tuple(upper), _to_sympy_tuple(lower)
+    tensor = super(AntiSymmetricTensor, cls).__new__(
+        cls, name, upper, lower, bra_ket_sym
+    )
+    # attach -1 if necessary
+    return -tensor if negative_sign else tensor
 
 
 class NonSymmetricTensor(SymbolicTensor):
@@ -250,9 +289,38 @@ class NonSymmetricTensor(SymbolicTensor):
     """
 
     def __new__(cls, name: str, indices: tuple[Index]):
-        symbol = sympify(name)
-        indices = Tuple(*indices)
-        return super().__new__(cls, symbol, indices)
+        return _build_nonsym(cls, _sympify_symbol(name), tuple(indices))
+
+    @classmethod
+    def build_many(cls, name: str, indices: Iterable[tuple[Index]]
+                   ) -> list['NonSymmetricTensor']:
+        """
+        Builds a tensor with the same name for each of the provided index
+        tuples. The tensors are taken from the same cache as tensors
+        constructed individually.
+
+        Parameters
+        ----------
+        name : str
+            The name of the tensors.
+        indices : Iterable[tuple[Index]]
+            The indices of the individual tensors.
+
+        Returns
+        -------
+        list[NonSymmetricTensor]
+            The tensors in the order of the provided indices.
+        """
+        symbol = _sympify_symbol(name)
+        return [_build_nonsym(cls, symbol, tuple(idx)) for idx in indices]
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clears the cache of previously constructed tensors. The cache holds
+        at most the last '_TENSOR_CACHE_SIZE' constructed tensors.
+        """
+        _build_nonsym.cache_clear()
 
     def _latex(self, printer) -> str:
         return "{%s_{%s}}" % (self.symbol, "".join([i._latex(printer)
@@ -272,6 +340,15 @@ class NonSymmetricTensor(SymbolicTensor):
         return self.args[1].args
 
 
+@lru_cache(maxsize=_TENSOR_CACHE_SIZE)
+def _build_nonsym(cls, name: Symbol, indices: tuple[Index]):
+    """
+    Constructs and caches an instance of a 'NonSymmetricTensor' (sub)class.
+    """
+    indices = _to_sympy_tuple(indices)
+    return super(NonSymmetricTensor, cls).__new__(cls, name, indices)
+
+
 class KroneckerDelta(Function):
     """
     Represents a Kronecker delta.
@@ -284,18 +361,26 @@ class KroneckerDelta(Function):
         Evaluates the KroneckerDelta. Adapted from sympy to also cover Spin.
         """
 
-        diff = i - j
-        if diff.is_zero or fuzzy_not(diff.is_zero):  # same index
+        if i is j:  # same index
             return S.One
+        elif isinstance(i, Index) and isinstance(j, Index):
+            # whether the difference of two indices is zero is only known
+            # for equal indices -> no need for the subtraction
+            if i == j:
+                return S.One
+        else:
+            diff = i - j
+            if diff.is_zero or fuzzy_not(diff.is_zero):  # same index
+                return S.One
 
-        spi, spj = i.space[0], j.space[0]
+        spi, spj = i._space0, j._space0
         if spi != "g" and spj != "g" and spi != spj:  # delta_ov / delta_vo
             return S.Zero
-        spi, spj = i.spin, j.spin
+        spi, spj = i._spin, j._spin
         if spi and spj and spi != spj:  # delta_ab / delta_ba
             return S.Zero
         # sort the indices of the delta
-        if i != min(i, j, key=sort_idx_canonical):
+        if i._canonical_key > j._canonical_key:
             return cls(j, i)
 
     def _eval_power(self, exp):
@@ -324,8 +409,8 @@ class KroneckerDelta(Function):
         will always try to keep the preferred index in the expression.
         """
         i, j = self.args
-        space1, spin1 = i.space[0], i.spin
-        space2, spin2 = j.space[0], j.spin
+        space1, spin1 = i._space0, i._spin
+        space2, spin2 = j._space0, j._spin
 
         if spin1 == spin2:  # nn / aa / bb  -> equal information
             if space1 == space2 or space2 == "g":  # oo / vv / gg / og / vg
@@ -347,4 +432,86 @@ class KroneckerDelta(Function):
     def indices_contain_equal_information(self) -> bool:
         """Whether both indices contain the same amount of information."""
         i, j = self.args
-        return i.space == j.space and i.spin == j.spin
+        return i._space0 == j._space0 and i._spin == j._spin
+
+
+@lru_cache(maxsize=None)
+def _sympify_symbol(name: str | Symbol) -> Symbol:
+    """Imports the name of a tensor to sympy."""
+    return sympify(name)
+
+
+# sympy does not provide a singleton for the empty Tuple
+_EMPTY_TUPLE = Tuple()
+
+
+def _to_sympy_tuple(seq: tuple | list) -> Tuple:
+    """Wraps the objects in a sympy Tuple reusing a single empty Tuple."""
+    return Tuple(*seq) if seq else _EMPTY_TUPLE
+
+
+# sequences of at least this length are not sorted with the bubble sort
+_SHORT_SEQUENCE = 6
+
+
+def _sort_with_parity(seq: tuple, key) -> tuple[list, int]:
+    """
+    Sorts the anticommuting objects and determines the parity of the
+    applied permutation. Short sequences are sorted using a bubble sort that
+    stops as soon as a pass finishes without a swap, i.e., already sorted
+    input only requires a single pass. Longer sequences are sorted in
+    O(n log n) and the parity is obtained from the cycles of the permutation.
+    Raises a 'ViolationOfPauliPrinciple' if two objects share the same key.
+
+    Returns
+    -------
+    tuple
+        The sorted objects and the parity of the applied permutation
+        (0 or 1).
+    """
+    if len(seq) >= _SHORT_SEQUENCE:
+        return _sort_long_with_parity(seq, key)
+
+    keyed = [(key(obj), obj) for obj in seq]
+    sign = 0
+    n = len(keyed) - 1
+    swapped = True
+    while swapped:
+        swapped = False
+        for i in range(n):
+            left, right = keyed[i][0], keyed[i+1][0]
+            if left == right:
+                raise ViolationOfPauliPrinciple([left, right])
+            elif left > right:
+                keyed[i], keyed[i+1] = keyed[i+1], keyed[i]
+                sign ^= 1
+                swapped = True
+        # the largest element is in place after each pass
+        n -= 1
+    return [obj for _, obj in keyed], sign
+
+
+def _sort_long_with_parity(seq: tuple, key) -> tuple[list, int]:
+    """
+    Sorts the anticommuting objects in O(n log n) and determines the parity
+    of the permutation from its cycle decomposition.
+    Raises a 'ViolationOfPauliPrinciple' if two objects share the same key.
+    """
+    keys = [key(obj) for obj in seq]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    for i, j in zip(order, order[1:]):
+        if keys[i] == keys[j]:
+            raise ViolationOfPauliPrinciple([keys[i], keys[j]])
+    # every cycle of length l can be decomposed in l-1 transpositions
+    sign = 0
+    visited = [False] * len(order)
+    for start in range(len(order)):
+        if visited[start]:
+            continue
+        i, length = start, 0
+        while not visited[i]:
+            visited[i] = True
+            i = order[i]
+            length += 1
+        sign ^= (length - 1) & 1
+    return [seq[i] for i in order], sign
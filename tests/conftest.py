@@ -40,29 +40,52 @@ def cls_instances():
     }
 
 
-@pytest.fixture(scope='session')
-def reference_data() -> dict[int, dict]:
+class LazyReferenceData:
+    """
+    Provides the reference data stored in the json files of a directory.
+    The data of a file is only imported when it is accessed for the first
+    time: reference_data['gs_energy'] imports 'gs_energy.json'.
+    """
+
+    def __init__(self, path_to_data: pathlib.Path):
+        self._path_to_data = path_to_data
+        self._cache = {}
+
+    def __getitem__(self, name: str) -> dict:
+        if name not in self._cache:
+            jsonfile = self._path_to_data / f"{name}.json"
+            if not jsonfile.is_file():
+                raise KeyError(name)
+            self._cache[name] = import_json_data(jsonfile)
+        return self._cache[name]
+
+
+def import_json_data(jsonfile: pathlib.Path) -> dict:
 
     def import_data_strings(data_dict: dict) -> dict:
         ret = {}
-        for key, val in data_dict.items():
-            if isinstance(val, dict):
-                ret[key] = import_data_strings(val)
-            elif isinstance(val, str):
-                ret[key] = import_from_sympy_latex(val)
-            else:
-                raise TypeError(f"Unknown type {type(val)}.")
+        stack = [(data_dict, ret)]
+        while stack:
+            data, imported = stack.pop()
+            for key, val in data.items():
+                if isinstance(val, dict):
+                    imported[key] = {}
+                    stack.append((val, imported[key]))
+                elif isinstance(val, str):
+                    imported[key] = import_from_sympy_latex(val)
+                else:
+                    raise TypeError(f"Unknown type {type(val)}.")
         return ret
 
     def hook(d): return {int(key) if key.isnumeric() else key: val
                          for key, val in d.items()}
 
-    cache = {}
+    with open(jsonfile, 'r') as f:
+        data = json.load(f, object_hook=hook)
+    return import_data_strings(data)
+
 
+@pytest.fixture(scope='session')
+def reference_data() -> LazyReferenceData:
     path_to_data = pathlib.Path(__file__).parent / 'reference_data'
-    for jsonfile in path_to_data.glob('*.json'):
-        data = json.load(open(jsonfile), object_hook=hook)
-        name = jsonfile.name.split('.json')  # remove .json extension
-        assert len(name) == 2
-        cache[name[0]] = import_data_strings(data)
-    return cache
+    return LazyReferenceData(path_to_data)
@@ -1,4 +1,6 @@
-from adcgen.indices import Indices
+from adcgen.indices import Indices, Index, _NUM_BITS
+from adcgen.misc import Inputerror
+import pytest
 
 
 class TestIndices:
@@ -30,3 +32,21 @@ class TestIndices:
             idx.get_generic_indices(n_g_a=2)
         assert idx.get_generic_indices(n_g_b=2) != \
             idx.get_generic_indices(n_g_b=2)
+
+
+class TestIndex:
+    @pytest.mark.parametrize('name', ['i', 'a', 'p', 'x', 'i1', 'a12', 'P3'])
+    def test_valid_name(self, name):
+        idx = Index(name)
+        assert idx.name == name
+
+    @pytest.mark.parametrize('name', [None, '', 'ij', 'i_1', '1i', 'i1a'])
+    def test_invalid_name(self, name):
+        # also the default Dummy name 'Dummy_<n>' is invalid
+        with pytest.raises(Inputerror):
+            Index(name)
+
+    def test_name_number_overflow(self):
+        Index(f"i{(1 << _NUM_BITS) - 1}")
+        with pytest.raises(Inputerror):
+            Index(f"i{1 << _NUM_BITS}")
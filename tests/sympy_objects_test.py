@@ -1,8 +1,16 @@
 from adcgen.indices import Index
 from adcgen.sympy_objects import (
-    KroneckerDelta, AntiSymmetricTensor, SymmetricTensor
+    KroneckerDelta, AntiSymmetricTensor, SymmetricTensor, Amplitude,
+    NonSymmetricTensor,
+    _sort_with_parity, _SHORT_SEQUENCE
 )
-from sympy import S
+from sympy import S, Symbol
+from sympy.physics.secondquant import (
+    _sort_anticommuting_fermions, ViolationOfPauliPrinciple
+)
+import itertools
+import pickle
+import random
 
 
 class TestAntiSymmetricTensor:
@@ -45,6 +53,32 @@ class TestAntiSymmetricTensor:
             AntiSymmetricTensor("V", (ia, ib), (i, j), 1) is S.Zero
         assert AntiSymmetricTensor("V", (i, j, ib), (i, ia, ib), 1) - \
             AntiSymmetricTensor("V", (i, ia, ib), (i, j, ib), 1) is S.Zero
+        # bra ket symmetry that is sympified to 0
+        assert AntiSymmetricTensor("V", (i,), (a,), "0") - \
+            AntiSymmetricTensor("V", (i,), (a,)) is S.Zero
+
+    def test_pickled_index(self):
+        # an index and its unpickled copy are equal -> Pauli principle
+        i = Index("i", below_fermi=True)
+        ip = pickle.loads(pickle.dumps(i))
+        a, b = Index("a", above_fermi=True), Index("b", above_fermi=True)
+        assert ip == i
+        assert AntiSymmetricTensor("V", (i, ip), (a, b)) is S.Zero
+
+    def test_cache(self):
+        i, j = Index("i", below_fermi=True), Index("j", below_fermi=True)
+        a, b = Index("a", above_fermi=True), Index("b", above_fermi=True)
+        tensor = AntiSymmetricTensor("V", (j, i), (a, b), 1)
+        assert AntiSymmetricTensor("V", (j, i), (a, b), 1) is tensor
+        assert AntiSymmetricTensor("V", [j, i], [a, b], 1) is tensor
+        # sympy rebuilds the tensor with the already imported name
+        assert AntiSymmetricTensor(Symbol("V"), (j, i), (a, b), 1) is tensor
+        AntiSymmetricTensor.clear_cache()
+        new_tensor = AntiSymmetricTensor("V", (j, i), (a, b), 1)
+        assert new_tensor is not tensor
+        assert new_tensor - tensor is S.Zero
+        # subclasses are not mixed up in the cache
+        assert isinstance(Amplitude("V", (i, j), (a, b), 1), Amplitude)
 
 
 class TestSymmetricTensor:
@@ -84,6 +118,14 @@ class TestSymmetricTensor:
             SymmetricTensor("V", (ia, ib), (i, j), 1) is S.Zero
 
 
+class TestNonSymmetricTensor:
+    def test_build_many(self):
+        i, j = Index("i", below_fermi=True), Index("j", below_fermi=True)
+        tensors = NonSymmetricTensor.build_many("e", [(i,), (j, i)])
+        assert tensors[0] is NonSymmetricTensor("e", (i,))
+        assert tensors[1] is NonSymmetricTensor(Symbol("e"), (j, i))
+
+
 class TestKroneckerDelta:
     def test_evaluation(self):
         i, j = Index("i"), Index("j")
@@ -110,3 +152,41 @@ class TestKroneckerDelta:
         assert KroneckerDelta(ia, p).preferred_and_killable == (ia, p)
         assert KroneckerDelta(ia, pa).preferred_and_killable == (ia, pa)
         assert KroneckerDelta(i, pa).preferred_and_killable is None
+
+
+class TestSortWithParity:
+    @staticmethod
+    def sort_reference(seq):
+        try:
+            res, sign = _sort_anticommuting_fermions(seq, key=lambda x: x)
+        except ViolationOfPauliPrinciple:
+            return None
+        return res, sign % 2
+
+    @staticmethod
+    def sort(seq):
+        try:
+            return _sort_with_parity(seq, key=lambda x: x)
+        except ViolationOfPauliPrinciple:
+            return None
+
+    def test_boundary(self):
+        # all permutations of sequences around the length at which the
+        # algorithm is switched
+        for n in (_SHORT_SEQUENCE - 1, _SHORT_SEQUENCE):
+            for seq in itertools.permutations(range(n)):
+                assert self.sort(seq) == self.sort_reference(seq)
+            # duplicates at the start, end and adjacent
+            for seq in [(0,) + tuple(range(n-1)),
+                        tuple(range(n-1)) + (n-2,),
+                        tuple(range(n-2)) + (0, 0)]:
+                assert self.sort(seq) is None
+                assert self.sort_reference(seq) is None
+
+    def test_long_sequences(self):
+        rng = random.Random(42)
+        for _ in range(2000):
+            n = rng.randint(_SHORT_SEQUENCE, 14)
+            # draw from a small range to also obtain duplicates
+            seq = tuple(rng.randint(0, 2 * n) for _ in range(n))
+            assert self.sort(seq) == self.sort_reference(seq)